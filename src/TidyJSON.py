@@ -1,11 +1,43 @@
 import re
-from enum import Enum
-from json import JSONDecodeError, dump, dumps, load, loads
+from enum import Enum, unique
+from io import StringIO
+from json import JSONDecodeError, JSONDecoder, dump, dumps, loads
 from pathlib import Path
-from sys import path
-from typing import Any, Callable, Dict, List, Union
-
-from attrs import define, field
+from sys import intern, path
+from types import MethodType
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO, Union
+
+from attrs import Attribute, define, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WHITESPACE = re.compile(r"\s*")
+# Runs of string content that need no special handling: anything but a quote,
+# a backslash or a control character.
+_STRING_CHUNK = re.compile(r'[^"\\\x00-\x1f]*')
+# Looser than the JSON grammar (leading zeros, '1.', '-.5') so the repair
+# parser accepts numbers that `float`/`int` can still read. The groups are the
+# integer, fraction and exponent parts.
+_NUMBER = re.compile(r"(-?[0-9]*)(\.[0-9]*)?([eE][-+]?[0-9]+)?")
+# Everything `clean_json_string` removes or replaces, matched in one pass:
+# /* comments */ and literal "\n" / "\r" escapes.
+_CLEANUP = re.compile(r"/\*.*?\*/|\\[nr]")
+# A \uXXXX escape, and one holding the low half of a UTF-16 surrogate pair.
+_UNICODE_ESCAPE = re.compile(r"\\u([0-9a-fA-F]{4})")
+_LOW_SURROGATE_ESCAPE = re.compile(r"\\u([dD][c-fC-F][0-9a-fA-F]{2})")
+_ESCAPES: Dict[str, str] = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
 
 @unique
 class TidyErrorType(Enum):
@@ -42,21 +74,27 @@ class ErrorContext:
         The type of error encountered (e.g., invalid character, missing bracket, etc.).
     position : int
         The position in the JSON string where the error occurred.
-    json_str : str
-        The JSON string being parsed when the error was encountered.
+    error_context : str
+        The snippet of the JSON string around the error position. Only the
+        snippet is kept, so a raised error does not hold on to the whole input.
 
     Methods
     -------
-    __attrs_post_init__():
-        Initializes the error context by extracting a snippet of the JSON string around the error position.
+    from_json(error_type, position, json_str):
+        Builds an error context by extracting a snippet of the JSON string around the error position.
     """
 
     error_type: TidyErrorType
     position: int
-    json_str: str
-
-    def __attrs_post_init__(self) -> None:
-        self.error_context = self.json_str[max(0, self.position - 10) : min(len(self.json_str), self.position + 10)]
+    error_context: str
+
+    @classmethod
+    def from_json(cls, error_type: TidyErrorType, position: int, json_str: str) -> "ErrorContext":
+        return cls(
+            error_type=error_type,
+            position=position,
+            error_context=json_str[max(0, position - 10) : position + 10],
+        )
 
 @define(slots=False, kw_only=True, auto_attribs=True, order=True)
 class ErrorManager(Exception):
@@ -98,12 +136,110 @@ def clean_json_string(json_str: str) -> str:
     The cleaned JSON string.
 
     """
-    json_str = re.sub(r"^\s+|\s+$", "", json_str)
-    json_str = re.sub(r"/\*.*?\*/", "", json_str)
-    return json_str.replace("\\n", " ").replace("\\r", " ").strip()
+    return _CLEANUP.sub(_cleanup_replacement, json_str).strip()
 
 
-@define(kw_only=True, auto_attribs=True, order=True)
+def _cleanup_replacement(match: re.Match) -> str:
+    """
+    Drops a matched comment and turns a literal "\\n" or "\\r" into a space.
+    """
+    return "" if match.group()[0] == "/" else " "
+
+
+def _iter_array(fp: TextIO, chunk_size: int) -> Iterator[Any]:
+    """
+    Yields the elements of a top-level JSON array, reading `fp` incrementally.
+
+    Only the unconsumed tail of the input is buffered. When an element runs
+    past the end of the buffer, more input is read and the element is decoded
+    again; the read size doubles on each retry, so a large element costs time
+    linear in its size. A trailing comma before the closing bracket is
+    tolerated; anything but whitespace after it is not.
+
+    Parameters
+    ----------
+    fp : A text stream positioned at the start of the JSON array.
+
+    chunk_size : The number of characters to read from `fp` at a time.
+
+    Raises
+    ------
+    JSONDecodeError
+        If the input is not an array, an element cannot be decoded, or data
+        follows the closing bracket. The position, line and column refer to
+        the whole document.
+    """
+    decoder = JSONDecoder()
+    buffer: str = ""
+    index: int = 0
+    eof: bool = False
+    expecting: str = "["
+    read_size: int = chunk_size
+    # Where the buffer starts in the document: character offset, line number
+    # and the offset at which that line starts.
+    offset: int = 0
+    line: int = 1
+    line_start: int = 0
+
+    def document_error(msg: str, pos: int) -> JSONDecodeError:
+        error = JSONDecodeError(msg, buffer, pos)
+        error.pos = offset + pos
+        error.lineno = line + buffer.count("\n", 0, pos)
+        last_newline: int = buffer.rfind("\n", 0, pos)
+        error.colno = pos - last_newline if last_newline >= 0 else error.pos - line_start + 1
+        error.args = (f"{msg}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    while True:
+        index = _WHITESPACE.match(buffer, index).end()
+        if index < len(buffer) or eof:
+            char: str = buffer[index : index + 1]
+            if expecting == "[":
+                if char != "[":
+                    raise document_error("Expecting '['", index)
+                expecting, index = "value", index + 1
+                continue
+            if expecting == "end":
+                if char:
+                    raise document_error("Extra data", index)
+                return
+            if char == "]":
+                expecting, index = "end", index + 1
+                continue
+            if expecting == ",":
+                if char != ",":
+                    raise document_error("Expecting ',' delimiter", index)
+                expecting, index = "value", index + 1
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, index)
+            except JSONDecodeError as e:
+                if eof:
+                    raise document_error(e.msg, e.pos) from None
+                read_size *= 2
+            else:
+                # A value that ends the buffer may be truncated, and so may a
+                # number followed by what could be the rest of its fraction or
+                # exponent (e.g. "-1e" of "-1e+20").
+                truncated: bool = end == len(buffer) or (
+                    type(value) in (int, float) and buffer[end] in "0123456789.eE+-"
+                )
+                if eof or not truncated:
+                    yield value
+                    expecting, index, read_size = ",", end, chunk_size
+                    continue
+                read_size *= 2
+        chunk: str = fp.read(read_size)
+        eof = not chunk
+        consumed: str = buffer[:index]
+        if (newlines := consumed.count("\n")):
+            line += newlines
+            line_start = offset + consumed.rfind("\n") + 1
+        offset += index
+        buffer, index = buffer[index:] + chunk, 0
+
+
+@define(slots=True, kw_only=True, auto_attribs=True, order=False, init=False)
 class TidyJSONParser:
     """
     This class is a refactoring with additional handling for nested JSON
@@ -163,7 +299,7 @@ class TidyJSONParser:
 
     parse_number: Parses a JSON number and returns an int or float.
 
-    parse_numeric_value : Parses an int/float from parse_number
+    parse_numeric_value : Parses an int/float from a numeric string.
 
     parse_boolean_or_null: Parses JSON literals 'true', 'false', and 'null'.
 
@@ -171,20 +307,47 @@ class TidyJSONParser:
 
     skip_whitespace: Used to skip the index past whitespaces.
 
+    skip_comma: Used to skip the index past whitespace and a comma delimiter.
+
     """
 
+    # `__init__` is hand-written and assigns every field, so these declarations
+    # only drive the generated slots, repr and eq.
     json_str: str
-    index: int = field(default=0)
-    json_out: Any = field(default=None, init=False)
-
-    def __attrs_post_init__(self) -> None:
-        """
-        A post-initialization method.
-
-        Initializes the parsing process and stores it in the attribute `json_out`.
-        """
-        self.json_str = clean_json_string(json_str=self.json_str)
-        self.json_out = self.parse()
+    index: int
+    json_out: Any
+    _n: int = field(repr=False, eq=False)
+
+    def __init__(self, *, json_str: str, index: int = 0) -> None:
+        """
+        Initializes the parser and parses `json_str`.
+
+        Written by hand rather than generated, so construction skips the
+        `__attrs_post_init__` hop. Well-formed input is decoded in a single
+        pass by the standard library's C-accelerated decoder. Otherwise the
+        input is cleaned and decoded again, and the character-level repair
+        parser only runs if that also fails. The result is stored in the
+        attribute `json_out`.
+        """
+        self.json_str = json_str
+        self.index = index
+        self.json_out = None
+        self._n = len(json_str)
+        # The C decoder recurses per nesting level, so very deep documents are
+        # left to the iterative parser as well.
+        try:
+            self.json_out = loads(s=json_str)
+            return
+        except (JSONDecodeError, RecursionError):
+            self.json_str = clean_json_string(json_str=self.json_str)
+            self._n = len(self.json_str)
+        try:
+            # Cleaning is often all the input needed, and the C decoder is far
+            # faster than the character-level parser, so give it another try
+            # (non-strict, to tolerate raw control characters in strings).
+            self.json_out = loads(s=self.json_str, strict=False)
+        except (JSONDecodeError, RecursionError):
+            self.json_out = self.parse()
 
     def parse(self) -> Union[Dict[str, Any], List[Any], str, float, int, bool, None]:
         """
@@ -206,27 +369,16 @@ class TidyJSONParser:
             If an unexpected token is encountered during parsing.
         """
         self.skip_whitespace()
-        char: str | bool = self.get_next_char()
-        method = self.get_parser_method(char)
-        parser_methods: Any = {
-            "{": self.parse_object,
-            "[": self.parse_array,
-            '"': self.parse_string,
-            "t": self.parse_boolean_or_null,
-            "f": self.parse_boolean_or_null,
-            "n": self.parse_boolean_or_null,
-        }
-        method: Any = parser_methods.get(
-            char, self.parse_number if char.isdigit() or char == "-" else None
-        )
-        if method:
-            return method()
-        else:
-            raise ErrorManager(
+        code: int = ord(self.json_str[self.index]) if self.index < self._n else 128
+        if code < 128 and (method := _DISPATCH[code]):
+            return method(self)
+        raise ErrorManager(
+            context=ErrorContext.from_json(
                 error_type=TidyErrorType.UNEXPECTED_TOKEN,
                 position=self.index,
                 json_str=self.json_str,
             )
+        )
 
     def get_parser_method(self, char: str) -> Callable[[], Dict[str, Any]] | Callable[[], List[Any]] | Callable[[], str] | Callable[[], bool | None] | Callable[[], float | int] | None:
         """
@@ -240,21 +392,10 @@ class TidyJSONParser:
         -------
         The parser method corresponding to the character input.
 
-        Returns
-        -------
-        The parser method corresponding to the character input.
-
         """
-        parser_methods = {
-        '{': self.parse_object,
-        '[': self.parse_array,
-        '"': self.parse_string,
-        't': self.parse_boolean_or_null,
-        'f': self.parse_boolean_or_null,
-        'n': self.parse_boolean_or_null
-    }
-
-        return parser_methods.get(char, self.parse_number if char.isdigit() or char == "-" else None)
+        code: int = ord(char) if len(char) == 1 else 128
+        method = _DISPATCH[code] if code < 128 else None
+        return MethodType(method, self) if method else None
 
     def parse_object(self) -> Dict[str, Any]:
         """
@@ -267,9 +408,7 @@ class TidyJSONParser:
         -------
         A dictionary representing the parsed JSON object.
         """
-        return self.parse_collection(
-            end_char="}", parse_func=self.parse_string, delimiter=":"
-        )
+        return self.parse_collection()
 
     def parse_array(self) -> List[Any]:
         """
@@ -282,57 +421,73 @@ class TidyJSONParser:
         -------
         A list representing the parsed JSON array.
         """
-        return self.parse_collection(end_char="]", parse_func=self.parse, delimiter=",")
+        return self.parse_collection()
 
-    def parse_collection(
-        self, end_char: str, parse_func: Callable, delimiter: str
-    ) -> Union[Dict[str, Any], List[Any]]:
+    def parse_collection(self) -> Union[Dict[str, Any], List[Any]]:
         """
         Generalized method for parsing JSON collections (objects and arrays).
 
         This method provides a unified approach to parse both JSON objects and
-        arrays. It handles the parsing logic, including delimiters and end
-        characters, and delegates the parsing of individual elements to a
-        specified function.
-
-        Parameters
-        ----------
-        end_char : The character that signifies the end of the collection.
-
-        parse_func : The function to call for parsing individual elements of
-        the collection.
-
-        delimiter : The character that separates elements in the collection.
+        arrays, starting at the opening '{' or '['. Nested collections are
+        tracked on an explicit stack rather than by recursion, so nesting
+        depth is not limited by Python's recursion limit. Other values are
+        delegated to `parse`.
 
         Returns
         -------
         The parsed collection, either a dictionary (for objects) or a list
         (for arrays).
         """
-        self.index += 1  # Skip start character ('{' or '[')
-        collection = {} if end_char == '}' else []
-        while (char := self.get_next_char()) != end_char:
-            if isinstance(collection, dict):
-                key = parse_func()
-                self.expect_and_skip(delimiter)
-                collection[key] = self.parse()
-            else:
-                collection.append(parse_func())
-            self.skip_whitespace()
-            if self.get_next_char() == ',':
-                self.index += 1
+        json_str: str = self.json_str
+        length: int = self._n
+        # Open collections, innermost last, and the keys of the open objects
+        # whose values are collections still being parsed.
+        stack: List[Union[Dict[str, Any], List[Any]]] = []
+        keys: List[str] = []
+        while True:
+            stack.append({} if json_str[self.index] == "{" else [])
+            self.index += 1  # Skip start character ('{' or '[')
+            while True:
+                collection = stack[-1]
                 self.skip_whitespace()
-        self.index += 1  # Skip end character ('}' or ']')
-        return collection
+                end_char: str = "}" if isinstance(collection, dict) else "]"
+                if self.index >= length or json_str[self.index] == end_char:
+                    self.index += 1  # Skip end character ('}' or ']')
+                    value = stack.pop()
+                    if not stack:
+                        return value
+                    if isinstance(stack[-1], dict):
+                        stack[-1][keys.pop()] = value
+                    else:
+                        stack[-1].append(value)
+                    self.skip_comma()
+                    continue
+                if isinstance(collection, dict):
+                    # Keys repeat across objects; interning shares one string per key.
+                    key = intern(self.parse_string())
+                    self.expect_and_skip(":")
+                    self.skip_whitespace()
+                if self.index < length and json_str[self.index] in "{[":
+                    if isinstance(collection, dict):
+                        keys.append(key)
+                    break  # Open the nested collection
+                if isinstance(collection, dict):
+                    collection[key] = self.parse()
+                else:
+                    collection.append(self.parse())
+                self.skip_comma()
 
     def expect_and_skip(self, expected_char: str) -> None:
         """
-        Expect a specific character and skip it, otherwise raise an error.
+        Skip any whitespace, then expect a specific character and skip it,
+        otherwise raise an error.
 
         """
-        if self.get_next_char() != expected_char:
-            raise ValueError(f"Expected '{expected_char}' at index {self.index}")
-        self.index += 1
+        json_str: str = self.json_str
+        index: int = _WHITESPACE.match(json_str, self.index).end()
+        if index >= self._n or json_str[index] != expected_char:
+            raise ValueError(f"Expected '{expected_char}' at index {index}")
+        self.index = index + 1
 
     def parse_string(self) -> str:
         """
@@ -340,20 +495,49 @@ class TidyJSONParser:
 
         This method extracts a string value from the JSON string, handling the
         escape characters and quotes that define the boundaries of a JSON
-        string.
+        string. Escapes are decoded as `json.loads` would, including surrogate
+        pairs; unknown or malformed escapes (e.g. "\\q") are kept verbatim,
+        backslash included.
 
         Returns
         -------
         The extracted string value from the JSON data.
         """
-        self.index += 1  # Skip opening quote
-        start: int = self.index
-        while (char := self.get_next_char()) != '"':
-            if char is False:
-                raise ValueError(f"Unterminated string starting at index {start}")
-            self.index += 1
-        self.index += 1  # Skip closing quote
-        return self.json_str[start : self.index - 1]
+        json_str: str = self.json_str
+        length: int = self._n
+        start: int = self.index + 1  # Skip opening quote
+        match = _STRING_CHUNK.match(json_str, start)
+        end: int = match.end()
+        if end < length and json_str[end] == '"':
+            self.index = end + 1  # Skip closing quote
+            return match.group()
+        chunks: List[str] = [match.group()]
+        while end < length and (char := json_str[end]) != '"':
+            if char == "\\":
+                if unicode := _UNICODE_ESCAPE.match(json_str, end):
+                    code_point: int = int(unicode.group(1), 16)
+                    end = unicode.end()
+                    if 0xD800 <= code_point <= 0xDBFF and (
+                        low := _LOW_SURROGATE_ESCAPE.match(json_str, end)
+                    ):
+                        code_point = 0x10000 + ((code_point - 0xD800) << 10) + (int(low.group(1), 16) - 0xDC00)
+                        end = low.end()
+                    chunks.append(chr(code_point))
+                else:
+                    escape: str = json_str[end + 1 : end + 2]
+                    chunks.append(_ESCAPES.get(escape, "\\" + escape))
+                    end += 2
+            else:
+                # Raw control characters are invalid JSON, but we keep them.
+                chunks.append(char)
+                end += 1
+            match = _STRING_CHUNK.match(json_str, end)
+            end = match.end()
+            chunks.append(match.group())
+        if end >= length:
+            raise ValueError(f"Unterminated string starting at index {start}")
+        self.index = end + 1  # Skip closing quote
+        return "".join(chunks)
 
 
     def parse_number(self) -> Union[float, int]:
@@ -369,20 +553,21 @@ class TidyJSONParser:
         The parsed number, returned as a float if it contains a decimal point,
         otherwise as an int.
         """
-        start = self.index
-        while (char := self.get_next_char()) and char in "0123456789-.eE":
-            self.index += 1
-        number_str = self.json_str[start : self.index]
-        return self.parse_numeric_value(number_str, start)
+        start: int = self.index
+        match = _NUMBER.match(self.json_str, start)
+        self.index = match.end()
+        # The integer group always takes part in the match, so a fraction or
+        # exponent is present exactly when a later group matched too.
+        return self.parse_numeric_value(match.group(), start, is_float=match.lastindex != 1)
 
-    def parse_numeric_value(self, number_str: str, start: int) -> Union[float, int]:
+    def parse_numeric_value(self, number_str: str, start: int, is_float: bool) -> Union[float, int]:
         """
 
         Parses a numeric value from a string, handling int and float types.
 
         """
         try:
-            return float(number_str) if '.' in number_str or 'e' in number_str or 'E' in number_str else int(number_str)
+            return float(number_str) if is_float else int(number_str)
         except ValueError as e:
             raise ValueError(f"Invalid number format at index {start}") from e
 
@@ -415,9 +600,11 @@ class TidyJSONParser:
                 return value
 
         raise ErrorManager(
-            error_type=TidyErrorType.UNEXPECTED_TOKEN,
-            position=self.index,
-            json_str=self.json_str
+            context=ErrorContext.from_json(
+                error_type=TidyErrorType.UNEXPECTED_TOKEN,
+                position=self.index,
+                json_str=self.json_str,
+            )
         )
 
 
@@ -434,9 +621,18 @@ class TidyJSONParser:
         string is reached.
         """
 
-        return self.json_str[self.index] if self.index < len(self.json_str) else False
+        return self.json_str[self.index] if self.index < self._n else False
 
 
+    def skip_comma(self) -> None:
+        """
+        Skips over whitespace and, if present, a single comma delimiter.
+
+        """
+        self.skip_whitespace()
+        if self.index < self._n and self.json_str[self.index] == ",":
+            self.index += 1
+
     def skip_whitespace(self) -> None:
         """
         Skips over spaces in the JSON string during parsing.
@@ -447,8 +643,32 @@ class TidyJSONParser:
         ----------
         char : The character to skip along with any spaces.
         """
-        while self.index < len(self.json_str) and self.json_str[self.index].isspace():
-            self.index += 1
+        self.index = _WHITESPACE.match(self.json_str, self.index).end()
+
+# Parser methods indexed by the code point of a value's first character, so
+# dispatch in `TidyJSONParser.parse` is a list lookup rather than a dict probe.
+# The parser indexes the `str` input rather than an encoded `bytes` copy:
+# CPython caches one-character Latin-1 strings, so `json_str[i]` allocates
+# nothing, and positions stay character offsets for `ErrorContext`.
+_DISPATCH: List[Optional[Callable[[TidyJSONParser], Any]]] = [None] * 128
+for _chars, _method in (
+    ("{", TidyJSONParser.parse_object),
+    ("[", TidyJSONParser.parse_array),
+    ('"', TidyJSONParser.parse_string),
+    ("-0123456789", TidyJSONParser.parse_number),
+    ("tfn", TidyJSONParser.parse_boolean_or_null),
+):
+    for _char in _chars:
+        _DISPATCH[ord(_char)] = _method
+
+
+def _recheck_for_file(instance: "TidyJSON", attribute: Attribute, value: str) -> str:
+    """
+    `on_setattr` hook for `TidyJSON.json_input`: keeps the cached file-path
+    check in step with the new input.
+    """
+    instance._is_file = value is not None and TidyJSON._check_for_file(value)
+    return value
 
 @define(kw_only=True, auto_attribs=True, order=True)
 class TidyJSON:
@@ -460,8 +680,9 @@ class TidyJSON:
     path-like string or a string directly. You may also provide a save
     location to save to a file when you are done.
 
-    Most of the heavy lifting is done by the TidyJSONParser class, which is a
-    subclass of Python's JSONDecoder class. This class handles the parsing of
+    Most of the heavy lifting is done by the TidyJSONParser class, which
+    decodes well-formed JSON with Python's standard `json` decoder and falls
+    back to its own repair parser otherwise. This class handles the parsing of
     the JSON string and provides the parsed JSON data to the TidyJSON class.
 
     To decode and parse JSON, which is TidyJSON's primary function:
@@ -473,7 +694,7 @@ class TidyJSON:
     from TidyJSON import TidyJSON
 
     tidy = TidyJSON(json_input=my_json_string)
-    decoded_string = tidy.decode
+    decoded_string = tidy.decode()
     ```
 
     Encoding a file, and saving to a file (note, strings will be automatically
@@ -488,9 +709,9 @@ class TidyJSON:
     tidy = TidyJSON(json_input=my_json_file,
     save_path=my_new_encoded_save_location)
 
-    decoded_json_file = tidy.decode
+    decoded_json_file = tidy.decode()
 
-    my_newly_encoded_file = tidy.encode
+    my_newly_encoded_file = tidy.encode()
     ```
 
     Similarly, if you want to decode a file, and pipe the decoded stream to
@@ -510,9 +731,9 @@ class TidyJSON:
         #do something with the encoded json
         pass
 
-    decoder = tidy.decode
+    decoder = tidy.decode()
     my_decoded_json = tidy.json
-    encoder = tidy.encode
+    encoder = tidy.encode()
 
     #we could also use decoder here; .decode returns the json attribute
     foo_output = foo(my_decoded_json)
@@ -527,24 +748,32 @@ class TidyJSON:
         going to be able to do anything useful.
 
     json: Stores the parsed JSON data. This attribute is set after
-        decoding the JSON input, and will be None until you use .decode.
+        decoding the JSON input, and will be None until you call .decode().
 
     save_path: A string representing the path where the JSON data will be
         saved. This attribute is set only if a save path is provided.
 
+    use_orjson: Whether to write `save_path` with orjson, if it is installed.
+        Off by default, since orjson's output differs from the standard
+        library's: it indents by two spaces, writes non-ASCII characters
+        unescaped, and writes NaN and +/-Infinity as null.
+
     Methods
     -------
 
-    decode: A property that decodes the JSON input into Python data
-        structures and populates the `json` attribute.
+    decode: Decodes the JSON input into Python data structures and
+        populates the `json` attribute.
 
-    encode: A property that encodes the Python data structures back into a JSON formatted string or saves it to a file if `save_path` is provided.
+    encode: Encodes the Python data structures back into a JSON formatted string or saves it to a file if `save_path` is provided.
+
+    iter_decode: A generator that decodes a top-level JSON array one element
+        at a time, reading files incrementally.
 
 
     Notes
     -----
-    The class uses properties for encoding and decoding to provide a simple
-    and intuitive interface.
+    Whether `json_input` is a file path is checked when it is set, at
+    initialization or later, rather than on every decode.
 
     The `_load_file`, `_load_string`, and `_check_for_file` methods are
     private utility methods:
@@ -553,18 +782,23 @@ class TidyJSON:
         _load_file: Loads JSON data from a file specified in `json_input`.
         _load_string: Loads JSON data from a string in `json_input`.
         _check_for_file: Checks if `json_input` is a valid file path.
+        _orjson_dumps: Serializes `json` with orjson, if enabled and installed.
     """
 
-    json_input: str = field(default=None, init=False)
+    json_input: str = field(default=None, on_setattr=_recheck_for_file)
     json: Any = field(default=None, init=False)
-    save_path: str = field(default=None, init=False)
+    save_path: str = field(default=None)
+    use_orjson: bool = field(default=False)
+    _is_file: bool = field(default=False, init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._is_file = self.json_input is not None and self._check_for_file(self.json_input)
 
-    @property
     def decode(self) -> Any:
         """
         Decodes the JSON input into Python data structures.
 
-        This property method handles the decoding of JSON data. If
+        This method handles the decoding of JSON data. If
         `json_input` is a file path, it loads the JSON from the file. If it's a JSON string, it decodes the string directly.
 
         Returns
@@ -576,28 +810,23 @@ class TidyJSON:
         ValueError
             If no JSON input is provided or if the input is not a valid JSON string or file path.
         """
-        if isinstance(self.json_input, Path):
-            try:
-                with open(file=Path(self.json_input), mode="r") as f:
-                    self.json = load(fp=f, cls=TidyJSONParser)
-                    return self.json
-            except JSONDecodeError:
-        elif isinstance(self.json_input, str):
-            try:
-                self.json = loads(s=self.json_input, cls=TidyJSONParser)
-                return self.json
-            except JSONDecodeError:
+        if self.json_input is None:
+            raise ValueError("TidyJSON object has no JSON input to decode.")
+        self.json = self._load_file() if self._is_file else self._load_string()
+        return self.json
 
-    @property
     def encode(self) -> Union[None, str]:
         """
 
         Encodes Python data structures back into a JSON formatted string or
         saves it to a file.
 
-        This property method handles the encoding of Python data structures to
+        This method handles the encoding of Python data structures to
         JSON. If a `save_path` is provided, it saves the JSON data to the
         specified file. Otherwise, it returns the JSON data as a string.
+        If `use_orjson` is set and orjson is installed it is used to write the
+        file, with the standard library as fallback. Strings are always
+        returned by the standard library's compact C encoder.
 
         Returns
         -------
@@ -609,15 +838,70 @@ class TidyJSON:
             If there is no JSON data to encode.
         """
 
-        if self.save_path:
-            with open(file=self.save_path, mode="w") as f:
-                dump(obj=self.json, fp=f, indent=4, strict=False)
-        elif self.json:
-            return dumps(strict=False)
-        else:
+        if self.json is None:
             raise ValueError(
                 "TidyJSON object has no data to encode in the instance json  attribute. Please pass data next time."
             )
+        if self.save_path:
+            if (encoded := self._orjson_dumps()) is not None:
+                with open(file=self.save_path, mode="wb") as f:
+                    f.write(encoded)
+            else:
+                with open(file=self.save_path, mode="w") as f:
+                    dump(obj=self.json, fp=f, indent=4)
+            return None
+        return dumps(obj=self.json)
+
+    def iter_decode(self, chunk_size: int = 65536) -> Iterator[Any]:
+        """
+        Lazily decodes a top-level JSON array, yielding one element at a time.
+
+        File input is read `chunk_size` characters at a time, so neither the
+        whole file nor the whole decoded array has to be held in memory.
+        Unlike `decode`, elements are decoded by the standard library decoder
+        only and are not repaired, and the `json` attribute is not set.
+
+        Parameters
+        ----------
+        chunk_size : The number of characters to read from a file at a time.
+
+        Yields
+        ------
+        Each element of the top-level array, in order.
+
+        Raises
+        ------
+        ValueError
+            If `chunk_size` is less than 1, no JSON input is provided, the
+            input is not an array, or an element is malformed.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+        if self.json_input is None:
+            raise ValueError("TidyJSON object has no JSON input to decode.")
+        if self._is_file:
+            with open(file=Path(self.json_input), mode="r") as f:
+                yield from _iter_array(fp=f, chunk_size=chunk_size)
+        else:
+            yield from _iter_array(fp=StringIO(self.json_input), chunk_size=chunk_size)
+
+    def _orjson_dumps(self) -> Optional[bytes]:
+        """
+        Serializes the `json` attribute with orjson, indented by two spaces,
+        if enabled and installed.
+
+        Returns
+        -------
+        The serialized JSON as UTF-8 bytes, or None if orjson is not enabled
+        or installed, or cannot serialize the data (e.g. integers wider than
+        64 bits).
+        """
+        if not self.use_orjson or orjson is None:
+            return None
+        try:
+            return orjson.dumps(self.json, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            return None
 
     def _load_file(self) -> Any:
         """
@@ -630,12 +914,10 @@ class TidyJSON:
         -------
         The Python representation of the loaded JSON data.
         """
-        try:
-            with open(file=Path(self.json_input), mode="r") as f:
-                return load(fp=f, cls=TidyJSONParser)
-        except JSONDecodeError:
+        with open(file=Path(self.json_input), mode="r") as f:
+            return TidyJSONParser(json_str=f.read()).json_out
 
-    def _load_string(self) -> None:
+    def _load_string(self) -> Any:
         """
         Loads JSON data from a string in `json_input`.
 
@@ -644,20 +926,29 @@ class TidyJSON:
 
         Returns
         -------
-        The method does not return a value but updates the `json` attribute of
-        the instance.
+        The Python representation of the loaded JSON data.
         """
-        return loads(s=self.json_input, cls=TidyJSONParser)
+        return TidyJSONParser(json_str=self.json_input).json_out
 
-    def _check_for_file(self) -> bool:
+    @staticmethod
+    def _check_for_file(json_input: str) -> bool:
         """
         Checks if `json_input` is a valid file path.
 
         This internal method verifies whether the provided `json_input` is a
         path to an existing file.
 
+        Parameters
+        ----------
+        json_input : The JSON input to check.
+
         Returns
         -------
         True if `json_input` is a valid file path, False otherwise.
         """
-        return Path(self.json_input).is_file()
+        try:
+            return Path(json_input).is_file()
+        except (OSError, ValueError):
+            # JSON strings can be too long, or contain characters that are
+            # invalid in a path.
+            return False